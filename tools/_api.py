@@ -0,0 +1,32 @@
+"""
+cursor-agents API endpoints used by the tool scripts.
+
+The base URL comes from CURSOR_AGENTS_URL (default: http://cursor-agents:3002)
+and is read once at import.
+"""
+
+import os
+
+BASE = os.environ.get('CURSOR_AGENTS_URL', 'http://cursor-agents:3002')
+
+AGENTS = f"{BASE}/agents"
+QUEUES = f"{BASE}/queues"
+TASK_OPERATOR = f"{BASE}/task-operator"
+LOCK = f"{TASK_OPERATOR}/lock"
+
+
+def _quote(segment: str) -> str:
+    from urllib.parse import quote
+
+    # safe='' so names containing '/', '#' or '?' stay a single path segment
+    return quote(segment, safe='')
+
+
+def agent_url(name: str) -> str:
+    """URL of a single agent, with the name percent-encoded."""
+    return f"{AGENTS}/{_quote(name)}"
+
+
+def queue_url(name: str) -> str:
+    """URL of a single queue, with the name percent-encoded."""
+    return f"{QUEUES}/{_quote(name)}"
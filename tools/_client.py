@@ -0,0 +1,86 @@
+"""
+Shared request and output helpers for the cursor-agents tool scripts.
+
+Wraps the _http transport and the _jsonfast codec into the result-dict
+contract the tools use: the parsed API response on success, or
+{'error': ..., 'status': ...} on failure.
+"""
+
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False  # avoids importing typing at runtime
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List, Optional
+
+
+def make_request(url: str, method: str = 'GET', data: Optional[Dict[str, Any]] = None,
+                 body: Optional[bytes] = None,
+                 parse: Optional[Callable[[bytes], Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Make HTTP request to cursor-agents API.
+
+    data is serialized as the JSON request body; body is an already encoded one.
+    parse turns a successful response body into the result (default: loads);
+    it should raise ValueError for a body it can't parse.
+    """
+    # Imported here so --help and argument errors never load the HTTP/JSON stack
+    from _http import HTTPStatusError, request
+    from _jsonfast import dumps_bytes, loads, loads_if_json
+
+    req_data = body
+    if data:
+        req_data = dumps_bytes(data)
+
+    try:
+        return (parse or loads)(request(method, url, req_data))
+    except HTTPStatusError as e:
+        # Parse the raw bytes; only decode to text when the body isn't a JSON error
+        error_data = loads_if_json(e.body)
+        if isinstance(error_data, dict) and 'error' in error_data:
+            return {'error': error_data['error'], 'status': e.code}
+        return {'error': e.body.decode('utf-8', errors='replace'), 'status': e.code}
+    except ConnectionError as e:
+        return {'error': f'Connection error: {str(e)}'}
+    except (OSError, ValueError) as e:
+        # Read timeouts, and bodies that aren't valid JSON (or gzip)
+        return {'error': str(e)}
+
+
+def get_json(url: str) -> Dict[str, Any]:
+    """GET url and return the parsed response or an error dict."""
+    return make_request(url)
+
+
+def get_many(urls: List[str]) -> Dict[str, Dict[str, Any]]:
+    """GET several URLs concurrently and return {url: result}.
+
+    Each worker thread has its own keep-alive connection in _http, so the
+    requests overlap instead of costing one round trip after another.
+    """
+    if len(urls) == 1:
+        return {urls[0]: get_json(urls[0])}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return dict(zip(urls, executor.map(get_json, urls)))
+
+
+def print_result(result: Dict[str, Any], json_errors: bool = True) -> None:
+    """Print the API result, or report its error on stderr and exit non-zero."""
+    from _jsonfast import dumps_pretty, write
+
+    if 'error' in result:
+        if json_errors:
+            # Errors are for humans, so they stay indented even when piped
+            sys.stderr.flush()
+            sys.stderr.buffer.write(dumps_pretty(result))
+        elif 'status' in result:
+            print(f"Error: HTTP {result['status']}: {result['error']}", file=sys.stderr)
+        else:
+            print(f"Error: {result['error']}", file=sys.stderr)
+        sys.exit(1)
+
+    write(result)
@@ -0,0 +1,288 @@
+"""
+Shared HTTP transport for the cursor-agents tool scripts.
+
+Talks to the API through http.client directly, skipping urllib.request's
+opener/handler chain. Each thread keeps one keep-alive connection per host,
+so several requests from the same process (ctl.py, the bulk and reset
+tools) reuse the socket instead of reconnecting. A socket the server has
+closed while idle is replaced before the request is sent.
+
+Responses are requested gzip-encoded and inflated here, so callers always get
+the plain body.
+
+Connecting times out after CURSOR_AGENTS_CONNECT_TIMEOUT seconds (default 2)
+and reading after CURSOR_AGENTS_READ_TIMEOUT seconds (default 30).
+
+Connection failures and 502/503/504 responses are retried with exponential
+backoff and jitter, since the API may still be starting up in the compose stack.
+Once a POST or PATCH has been sent, neither a failure while reading its
+response nor a 502/503/504 is retried, since the server may already have
+acted on it.
+"""
+
+from __future__ import annotations
+
+import http.client
+import os
+import socket
+import threading
+from urllib.parse import urlsplit
+
+TYPE_CHECKING = False  # avoids importing typing at runtime
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+    T = TypeVar('T')
+
+# Listings compress well; the server may answer gzip-encoded
+DEFAULT_HEADERS = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+
+
+def _env_timeout(name: str, default: float) -> float:
+    """Read a timeout in seconds from the environment.
+
+    Falls back to default for unset, non-numeric, non-positive or infinite
+    values; 0 would make the socket non-blocking.
+    """
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if 0 < value < float('inf') else default
+
+
+# Seconds; connecting fails fast while slow responses still get the full read timeout
+CONNECT_TIMEOUT = _env_timeout('CURSOR_AGENTS_CONNECT_TIMEOUT', 2.0)
+DEFAULT_TIMEOUT = _env_timeout('CURSOR_AGENTS_READ_TIMEOUT', 30.0)
+
+MAX_RETRIES = 3
+RETRY_BASE = 1.0
+RETRY_CAP = 30.0
+RETRY_JITTER = 0.5
+RETRY_STATUSES = (502, 503, 504)
+
+# Methods that are safe to resend once the request may have reached the server
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+# Seconds a getaddrinfo() result is reused for new connections
+DNS_TTL = 60.0
+
+# Per-thread {(scheme, host:port): HTTPConnection}
+_local = threading.local()
+
+# {(host, port): (expires_at, addresses)}, shared by all threads
+_addresses: Dict[Tuple[str, int], Tuple[float, list]] = {}
+
+
+class ResponseError(OSError):
+    """Raised when reading the response to a non-idempotent request fails.
+
+    The request was sent, so the server may already have acted on it; it is
+    not retried.
+    """
+
+
+class HTTPStatusError(Exception):
+    """Raised when the API answers with a non-2xx status code."""
+
+    def __init__(self, code: int, body: bytes):
+        super().__init__(f'HTTP {code}')
+        self.code = code
+        self.body = body
+
+
+def retry(fn: Callable[[], T], max_retries: int = MAX_RETRIES, base: float = RETRY_BASE,
+          cap: float = RETRY_CAP, statuses: Tuple[int, ...] = RETRY_STATUSES) -> T:
+    """Call fn, retrying transient failures with exponential backoff and jitter.
+
+    Only connection errors and responses with a status in statuses are
+    retried; other HTTP errors (4xx in particular) are raised immediately.
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except (ConnectionError, HTTPStatusError) as e:
+            if isinstance(e, HTTPStatusError) and e.code not in statuses:
+                raise
+            if attempt >= max_retries:
+                raise
+            import random
+            import time
+            time.sleep(min(cap, base * 2 ** attempt) * (1 + random.random() * RETRY_JITTER))
+            attempt += 1
+
+
+def _create_connection(address: Tuple[str, int], timeout: float,
+                       source_address: Optional[Tuple[str, int]] = None) -> socket.socket:
+    """socket.create_connection() with the address lookup cached for DNS_TTL.
+
+    Only successful lookups are cached, and an entry is dropped when none
+    of its addresses accept a connection so the next attempt re-resolves.
+    """
+    import time
+
+    now = time.monotonic()
+    cached = _addresses.get(address)
+    if cached is None or cached[0] <= now:
+        infos = socket.getaddrinfo(*address, type=socket.SOCK_STREAM)
+        cached = _addresses[address] = (now + DNS_TTL, [info[4][:2] for info in infos])
+
+    error: Optional[OSError] = None
+    for sockaddr in cached[1]:
+        try:
+            return socket.create_connection(sockaddr, timeout, source_address)
+        except OSError as e:
+            error = e
+    _addresses.pop(address, None)
+    raise error
+
+
+class _ConnectMixin:
+    """Connect through the address cache with CONNECT_TIMEOUT, then switch the
+    socket to the read timeout.
+
+    self.host keeps the original name, so the Host header and TLS server name
+    are unaffected by connecting to a cached IP.
+    """
+
+    def __init__(self, *args: object, **kwargs: object):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _create_connection
+
+    def connect(self) -> None:
+        read_timeout = self.timeout
+        self.timeout = min(CONNECT_TIMEOUT, read_timeout)
+        try:
+            super().connect()
+        except TimeoutError as e:
+            # Nothing was sent yet, so report it as a (retryable) connection failure
+            raise ConnectionError(f'connect timed out after {self.timeout:g}s') from e
+        finally:
+            self.timeout = read_timeout
+        self.sock.settimeout(read_timeout)
+
+
+class _HTTPConnection(_ConnectMixin, http.client.HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_ConnectMixin, http.client.HTTPSConnection):
+    pass
+
+
+def _closed_by_peer(sock: socket.socket) -> bool:
+    """Whether an idle keep-alive socket has been closed by the server.
+
+    An idle socket should have nothing to read; if select() reports it
+    readable, the server has closed it (or sent something unexpected).
+    """
+    import select
+
+    try:
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    """Return this thread's connection to netloc, creating it on first use."""
+    connections: Dict[Tuple[str, str], http.client.HTTPConnection] = _local.__dict__.setdefault('connections', {})
+    conn = connections.get((scheme, netloc))
+    if conn is None:
+        conn_class = _HTTPSConnection if scheme == 'https' else _HTTPConnection
+        conn = connections[(scheme, netloc)] = conn_class(netloc, timeout=timeout)
+        return conn
+
+    if conn.sock is not None and _closed_by_peer(conn.sock):
+        # Reconnect now rather than have the request fail on a dead socket
+        conn.close()
+    if conn.timeout != timeout:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def _exchange(conn: http.client.HTTPConnection, method: str, path: str,
+              body: Optional[bytes]) -> Tuple[http.client.HTTPResponse, bytes]:
+    """Send the request and read the response.
+
+    Failures raise ConnectionError (retryable) unless the request was fully
+    sent and its method isn't idempotent: the server may then already have
+    acted on it, so ResponseError is raised instead. A path http.client
+    refuses to send raises ValueError.
+    """
+    try:
+        conn.request(method, path, body=body, headers=DEFAULT_HEADERS)
+    except http.client.InvalidURL as e:
+        # Rejected before anything was sent (e.g. a space in the path);
+        # retrying won't help. close() resets the half-started request.
+        conn.close()
+        raise ValueError(f'Invalid URL path {path!r}: {e}') from e
+    except (OSError, http.client.HTTPException) as e:
+        # Drop the socket so a retry starts from a fresh connection
+        conn.close()
+        raise ConnectionError(str(e) or type(e).__name__) from e
+
+    try:
+        response = conn.getresponse()
+        return response, response.read()
+    except TimeoutError:
+        conn.close()
+        raise
+    except (OSError, http.client.HTTPException) as e:
+        conn.close()
+        if method in IDEMPOTENT_METHODS:
+            raise ConnectionError(str(e) or type(e).__name__) from e
+        raise ResponseError(f'{str(e) or type(e).__name__} (after sending {method}; not retried)') from e
+
+
+def _send(method: str, url: str, body: Optional[bytes], timeout: float) -> bytes:
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path = f'{path}?{parts.query}'
+
+    try:
+        conn = _connection(parts.scheme, parts.netloc, timeout)
+    except http.client.InvalidURL as e:
+        # A malformed CURSOR_AGENTS_URL (e.g. a non-numeric port); retrying won't help
+        raise ValueError(f'Invalid URL {url!r}: {e}') from e
+    reused = conn.sock is not None
+    try:
+        response, data = _exchange(conn, method, path, body)
+    except ConnectionError:
+        # The server dropped the keep-alive socket after the idle check; the
+        # request is safe to resend, so reconnect once right away
+        if not reused:
+            raise
+        response, data = _exchange(conn, method, path, body)
+
+    if response.getheader('Content-Encoding') == 'gzip':
+        # zlib is a builtin; the gzip module would pull in io, struct and friends
+        import zlib
+        try:
+            data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+        except zlib.error as e:
+            raise ValueError(f'Invalid gzip response body: {e}') from e
+
+    if response.status >= 400:
+        raise HTTPStatusError(response.status, data)
+    return data
+
+
+def request(method: str, url: str, body: Optional[bytes] = None,
+            timeout: float = DEFAULT_TIMEOUT) -> bytes:
+    """Send a request and return the raw response body.
+
+    Raises HTTPStatusError for non-2xx responses and ConnectionError
+    when the server cannot be reached, once retries are exhausted.
+    A read timeout raises TimeoutError, an invalid URL or corrupt body
+    ValueError, and a failed response to a sent POST or PATCH ResponseError.
+    """
+    # A gateway error doesn't say whether the request reached the API, so
+    # only requests that are safe to repeat are resent after one
+    statuses = RETRY_STATUSES if method in IDEMPOTENT_METHODS else ()
+    return retry(lambda: _send(method, url, body, timeout), statuses=statuses)
@@ -0,0 +1,150 @@
+"""
+Shared JSON helpers for the cursor-agents tool scripts.
+
+Uses the standard library json module, switching to orjson when it is
+installed and a payload is large enough to pay for importing it.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+TYPE_CHECKING = False  # avoids importing typing at runtime
+
+if TYPE_CHECKING:
+    from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+# Importing orjson takes a few ms (it pulls in uuid, zoneinfo and platform),
+# more than it saves on typical listings, so it is only loaded for payloads
+# of at least this many bytes. Once loaded it is used for all output too.
+ORJSON_MIN_BYTES = 256 * 1024
+
+# The orjson module once loaded, False if it isn't installed, None if not tried yet
+_orjson: Any = None
+
+# orjson option masks for output lines, computed once by _load_orjson()
+_OPT_PRETTY = _OPT_COMPACT = 0
+
+# Encoders are built once per (indent, default) and reused. Output is
+# always UTF-8, so ensure_ascii=False skips the \uXXXX escaping pass.
+# Lone surrogates (valid in JSON escapes, e.g. from Node's JSON.stringify)
+# can't be encoded as UTF-8; _ENCODE_ERRORS writes them back as the same
+# \udXXX escape instead, which is valid since they only occur in strings.
+_ENCODE_ERRORS = 'backslashreplace'
+_ENCODERS: Dict[Tuple[bool, Any], json.JSONEncoder] = {}
+
+
+def _load_orjson() -> Any:
+    """Import orjson on first call and remember the outcome."""
+    global _orjson, _OPT_PRETTY, _OPT_COMPACT
+    if _orjson is None:
+        if sys.implementation.name == 'pypy':
+            # PyPy's JIT handles the pure-Python json module well, while
+            # orjson wheels for PyPy are missing or go through cpyext
+            _orjson = False
+            return _orjson
+        try:
+            import orjson
+        except ImportError:
+            _orjson = False
+        else:
+            _OPT_PRETTY = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+            _OPT_COMPACT = orjson.OPT_APPEND_NEWLINE
+            _orjson = orjson
+    return _orjson
+
+
+def _encoder(indent: bool, default: Any) -> json.JSONEncoder:
+    encoder = _ENCODERS.get((indent, default))
+    if encoder is None:
+        encoder = _ENCODERS[(indent, default)] = json.JSONEncoder(
+            ensure_ascii=False,
+            indent=2 if indent else None,
+            separators=None if indent else (',', ':'),
+            default=default
+        )
+    return encoder
+
+
+def loads(s: Any) -> Any:
+    """Parse JSON from str or UTF-8 bytes."""
+    if len(s) >= ORJSON_MIN_BYTES and _load_orjson():
+        try:
+            return _orjson.loads(s)
+        except JSONDecodeError:
+            # orjson rejects lone surrogate escapes that json accepts;
+            # truly invalid input raises again below
+            pass
+    return json.loads(s)
+
+
+def dumps_bytes(o: Any) -> bytes:
+    """Serialize to compact UTF-8 bytes (for request bodies)."""
+    if _orjson:
+        try:
+            return _orjson.dumps(o)
+        except _orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates; the stdlib encoder escapes them
+    return _encoder(False, None).encode(o).encode('utf-8', _ENCODE_ERRORS)
+
+
+def dumps_pretty(o: Any, default: Any = None) -> bytes:
+    """Serialize to an indented JSON line as UTF-8 bytes."""
+    if _orjson:
+        try:
+            return _orjson.dumps(o, option=_OPT_PRETTY, default=default)
+        except _orjson.JSONEncodeError:
+            pass
+    return (_encoder(True, default).encode(o) + '\n').encode('utf-8', _ENCODE_ERRORS)
+
+
+def dumps_compact(o: Any, default: Any = None) -> bytes:
+    """Serialize to a compact JSON line as UTF-8 bytes."""
+    if _orjson:
+        try:
+            return _orjson.dumps(o, option=_OPT_COMPACT, default=default)
+        except _orjson.JSONEncodeError:
+            pass
+    return (_encoder(False, default).encode(o) + '\n').encode('utf-8', _ENCODE_ERRORS)
+
+
+def write(o: Any, stream: Optional[BinaryIO] = None, default: Any = None) -> None:
+    """Write JSON plus a newline as UTF-8 bytes (stdout by default).
+
+    Output is indented for terminals and compact when piped.
+    """
+    stream = _output_stream(stream)
+    serialize = dumps_pretty if stream.isatty() else dumps_compact
+    stream.write(serialize(o, default))
+
+
+def loads_if_json(data: bytes) -> Any:
+    """Parse data if it looks like a JSON object or array, otherwise return None.
+
+    Checking the first non-whitespace byte skips a doomed parse (and the
+    exception it raises) for HTML or plain-text error pages.
+    """
+    for byte in data:
+        if byte not in b' \t\r\n':
+            break
+    else:
+        return None
+    # Scanning instead of data.lstrip() avoids copying the body
+    if byte not in b'{[':
+        return None
+    try:
+        return loads(data)
+    except JSONDecodeError:
+        return None
+
+
+def _output_stream(stream: Optional[BinaryIO]) -> BinaryIO:
+    if stream is None:
+        # Keep ordering with anything already printed through the text layer
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+    return stream
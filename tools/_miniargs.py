@@ -0,0 +1,63 @@
+"""
+Minimal argument parser for the tool commands with fixed, simple options.
+
+Handles only the common shapes (--name VALUE, --name=VALUE, -n VALUE) for a
+declarative spec and returns None for anything else (--help, unknown or
+missing options, unusual syntax), so the caller can fall back to argparse
+for help text and error messages. This keeps argparse off the normal path.
+"""
+
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False  # avoids importing typing at runtime
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Tuple
+
+    # dest -> (short flag, required); the long flag is --dest with '_' as '-'
+    Spec = Dict[str, Tuple[str, bool]]
+
+
+class Namespace:
+    """Attribute container returned by parse(), like argparse.Namespace."""
+
+    def __init__(self, **kwargs: object):
+        self.__dict__.update(kwargs)
+
+    def __repr__(self) -> str:
+        args = ', '.join(f'{k}={v!r}' for k, v in self.__dict__.items())
+        return f'Namespace({args})'
+
+
+def parse(spec: Spec, argv: Optional[List[str]] = None) -> Optional[Namespace]:
+    """Parse argv (default: sys.argv[1:]) against spec, or return None."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    flags = {}
+    for dest, (short, _) in spec.items():
+        flags['--' + dest.replace('_', '-')] = dest
+        flags[short] = dest
+
+    values: Dict[str, Optional[str]] = dict.fromkeys(spec)
+    i = 0
+    while i < len(argv):
+        flag, sep, value = argv[i].partition('=')
+        dest = flags.get(flag)
+        if dest is None or (sep and not flag.startswith('--')):
+            return None
+        if not sep:
+            i += 1
+            if i >= len(argv) or argv[i].startswith('-'):
+                return None
+            value = argv[i]
+        values[dest] = value
+        i += 1
+
+    for dest, (_, required) in spec.items():
+        if required and values[dest] is None:
+            return None
+
+    return Namespace(**values)
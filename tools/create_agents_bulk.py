@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Create Agents in Bulk Tool
+
+Creates many agents at once from a JSONL file. Requests are sent concurrently
+(bounded by --concurrency) instead of one after another, so creating N agents
+takes roughly as long as the slowest request rather than N round trips.
+
+Usage:
+    python create_agents_bulk.py --file <agents.jsonl> [--concurrency <n>]
+
+Required Arguments:
+    --file, -f               JSONL file with one agent config per line ("-" reads stdin)
+
+Optional Arguments:
+    --concurrency, -c        Maximum number of requests in flight (default: 16)
+    --help, -h               Show this help message
+
+Input Format:
+    Each non-empty line is a JSON object in the same shape create_agent.py sends
+    to the API, for example:
+    {"name": "daily-check", "targetUrl": "http://api.example.com/check", "method": "GET", "schedule": "0 0 * * *"}
+    {"name": "test-agent", "targetUrl": "http://cursor-runner:3001/health", "oneTime": true}
+
+Output:
+    Returns a JSON array with one entry per input line, in input order. Each entry
+    is the API response for that agent, or an error object:
+    {
+      "name": "agent-name",
+      "error": "Error message",
+      "status": 400
+    }
+
+    Exits with status 1 if any agent could not be created.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from _api import AGENTS
+from _client import make_request
+
+TYPE_CHECKING = False  # avoids importing typing at runtime
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List
+
+
+PARSER = argparse.ArgumentParser(
+    description="Create many agents concurrently from a JSONL file",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog=__doc__
+)
+
+PARSER.add_argument(
+    '--file', '-f',
+    required=True,
+    help='JSONL file with one agent config per line ("-" reads stdin)'
+)
+PARSER.add_argument(
+    '--concurrency', '-c',
+    type=int,
+    default=16,
+    help='Maximum number of requests in flight (default: 16)'
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    return PARSER.parse_args()
+
+
+def read_configs(path: str) -> List[Dict[str, Any]]:
+    """Read agent configs from a JSONL file, exiting on invalid lines."""
+    from _jsonfast import JSONDecodeError, loads
+
+    try:
+        stream = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    except OSError as e:
+        print(f"Error: Cannot read {path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    configs = []
+    with stream:
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                config = loads(line)
+            except JSONDecodeError as e:
+                print(f"Error: Invalid JSON on line {line_number}: {e}", file=sys.stderr)
+                sys.exit(1)
+            if not isinstance(config, dict) or 'name' not in config:
+                print(f"Error: Line {line_number} must be a JSON object with a name", file=sys.stderr)
+                sys.exit(1)
+            configs.append(config)
+    return configs
+
+
+def create_agents(configs: List[Dict[str, Any]], concurrency: int = 16) -> List[Dict[str, Any]]:
+    """Create the agents concurrently and return the results in input order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def create(config: Dict[str, Any]) -> Dict[str, Any]:
+        result = make_request(AGENTS, method='POST', data=config)
+        if 'error' in result:
+            return {'name': config['name'], **result}
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        return list(executor.map(create, configs))
+
+
+def main():
+    """Main entry point."""
+    args = parse_arguments()
+    from _jsonfast import write
+
+    configs = read_configs(args.file)
+    results = create_agents(configs, args.concurrency)
+
+    write(results)
+
+    if any('error' in result for result in results):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
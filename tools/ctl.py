@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Cursor-Agents Control Tool
+
+Single entry point for the agent, queue and task operator tools. Running
+several commands from one interpreter avoids paying Python startup per step.
+The individual scripts (create_agent.py, delete_agent.py, ...) are thin
+wrappers around the commands below and keep working unchanged.
+
+Usage:
+    python ctl.py <command> [options]
+
+Commands:
+    create-agent             Create a new agent (see create_agent.py)
+    delete-agent             Delete an agent (see delete_agent.py)
+    get-agent-status         Get the status of an agent (see get_agent_status.py)
+    delete-queue             Delete an empty queue (see delete_queue.py)
+    enable-task-operator     Enable the task operator (see enable_task_operator.py)
+    disable-task-operator    Disable the task operator (see disable_task_operator.py)
+    check-lock               Check the task operator Redis lock (see check_task_operator_lock.py)
+    clear-lock               Clear the task operator Redis lock (see clear_task_operator_lock.py)
+
+Examples:
+    python ctl.py create-agent --name "test-agent" --target-url "http://cursor-runner:3001/health" --one-time
+    python ctl.py get-agent-status --name "test-agent"
+    python ctl.py check-lock
+    python ctl.py <command> --help
+"""
+
+from __future__ import annotations
+
+import sys
+
+import _api
+from _client import make_request, print_result
+
+TYPE_CHECKING = False  # avoids importing typing at runtime
+
+if TYPE_CHECKING:
+    import argparse
+    from typing import Any, Callable, Dict, List, Optional, Tuple
+
+    from _miniargs import Spec
+
+    Command = Tuple[str, Callable[[argparse.ArgumentParser], None], Callable[[argparse.Namespace], None]]
+
+
+# create-agent
+
+def add_create_agent_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register create-agent arguments."""
+    # Required arguments
+    parser.add_argument(
+        '--name', '-n',
+        required=True,
+        help='Unique name for the agent'
+    )
+    parser.add_argument(
+        '--target-url', '-u',
+        required=True,
+        dest='target_url',
+        help='Target URL to hit (can be public URL or Docker network URL)'
+    )
+
+    # Optional arguments
+    parser.add_argument(
+        '--method', '-m',
+        choices=['GET', 'POST', 'PUT', 'DELETE', 'PATCH'],
+        default='POST',
+        help='HTTP method to use (default: POST)'
+    )
+    parser.add_argument(
+        '--headers', '-H',
+        default='{}',
+        help='HTTP headers as JSON object (default: {})'
+    )
+    parser.add_argument(
+        '--body', '-b',
+        help='Request body as JSON string (for POST, PUT, PATCH methods)'
+    )
+    parser.add_argument(
+        '--schedule', '-s',
+        help='Cron pattern (e.g., "0 */5 * * * *" for every 5 minutes) or interval. Required if --one-time is false'
+    )
+    parser.add_argument(
+        '--one-time', '-o',
+        action='store_true',
+        default=False,
+        help='If true, run the agent once immediately (default: false)'
+    )
+    parser.add_argument(
+        '--timeout', '-t',
+        type=int,
+        default=30000,
+        help='Request timeout in milliseconds (default: 30000)'
+    )
+    parser.add_argument(
+        '--queue', '-q',
+        help='Queue name to use for this agent (defaults to "default" if not specified)'
+    )
+
+
+def validate_arguments(args: argparse.Namespace) -> None:
+    """Validate arguments and store the parsed --headers/--body on args."""
+    from _jsonfast import JSONDecodeError, loads
+
+    if not args.one_time and not args.schedule:
+        print("Error: Either --one-time must be true or --schedule must be provided", file=sys.stderr)
+        sys.exit(1)
+
+    # Validate headers JSON, keeping the parsed value for build_agent_config
+    try:
+        args.headers_parsed = loads(args.headers)
+    except JSONDecodeError as e:
+        print(f"Error: Invalid JSON in --headers: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not isinstance(args.headers_parsed, dict):
+        print("Error: --headers must be a JSON object", file=sys.stderr)
+        sys.exit(1)
+
+    # Validate body JSON if provided
+    args.body_parsed = None
+    if args.body:
+        try:
+            args.body_parsed = loads(args.body)
+        except JSONDecodeError as e:
+            print(f"Error: Invalid JSON in --body: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+def build_agent_config(args: argparse.Namespace) -> Dict[str, Any]:
+    """Build the agent configuration dictionary from validated arguments."""
+    config: Dict[str, Any] = {
+        'name': args.name,
+        'targetUrl': args.target_url,
+        'method': args.method,
+        'headers': args.headers_parsed,
+        'oneTime': args.one_time,
+        'timeout': args.timeout,
+    }
+
+    if args.body:
+        config['body'] = args.body_parsed
+
+    if not args.one_time and args.schedule:
+        config['schedule'] = args.schedule
+
+    if args.queue:
+        config['queue'] = args.queue
+
+    return config
+
+
+def create_agent(args: argparse.Namespace) -> None:
+    """Create a new agent."""
+    validate_arguments(args)
+    config = build_agent_config(args)
+    print_result(make_request(_api.AGENTS, method='POST', data=config))
+
+
+# delete-agent / get-agent-status
+
+def add_delete_agent_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register delete-agent arguments."""
+    parser.add_argument(
+        '--name', '-n',
+        required=True,
+        help='Name of the agent to delete'
+    )
+
+
+def add_get_agent_status_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register get-agent-status arguments."""
+    parser.add_argument(
+        '--name', '-n',
+        required=True,
+        help='Name of the agent to get status for'
+    )
+
+
+def delete_agent(args: argparse.Namespace) -> None:
+    """Delete an agent."""
+    print_result(make_request(_api.agent_url(args.name), method='DELETE'))
+
+
+def get_agent_status(args: argparse.Namespace) -> None:
+    """Get the status of an agent."""
+    print_result(make_request(_api.agent_url(args.name)))
+
+
+# delete-queue
+
+def add_queue_name_argument(parser: argparse.ArgumentParser) -> None:
+    """Register the --queue-name argument."""
+    parser.add_argument(
+        '--queue-name', '-q',
+        required=True,
+        dest='queue_name',
+        help='Name of the queue to delete'
+    )
+
+
+def delete_queue(args: argparse.Namespace) -> None:
+    """Delete an empty queue."""
+    print_result(make_request(_api.queue_url(args.queue_name), method='DELETE'))
+
+
+# task operator
+
+# Queue the server uses when the enable request doesn't name one
+DEFAULT_TASK_OPERATOR_QUEUE = 'task-operator'
+
+# The enable endpoint destructures req.body, so it always needs a JSON object
+EMPTY_BODY = b'{}'
+
+
+def add_task_operator_queue_argument(parser: argparse.ArgumentParser) -> None:
+    """Register enable-task-operator arguments."""
+    parser.add_argument(
+        '--queue', '-q',
+        default=DEFAULT_TASK_OPERATOR_QUEUE,
+        help=f'Queue name to use for the task operator (default: "{DEFAULT_TASK_OPERATOR_QUEUE}")'
+    )
+
+
+def add_no_arguments(parser: argparse.ArgumentParser) -> None:
+    """Commands without options only get the default --help."""
+
+
+def enable_task_operator(args: argparse.Namespace) -> None:
+    """Enable the task operator agent."""
+    # Only serialize a body when a non-default queue is requested
+    if args.queue and args.queue != DEFAULT_TASK_OPERATOR_QUEUE:
+        result = make_request(_api.TASK_OPERATOR, method='POST', data={'queue': args.queue})
+    else:
+        result = make_request(_api.TASK_OPERATOR, method='POST', body=EMPTY_BODY)
+    print_result(result, json_errors=False)
+
+
+def disable_task_operator(args: argparse.Namespace) -> None:
+    """Disable the task operator agent."""
+    print_result(make_request(_api.TASK_OPERATOR, method='DELETE'), json_errors=False)
+
+
+def check_lock(args: argparse.Namespace) -> None:
+    """Check the task operator Redis lock status."""
+    print_result(make_request(_api.LOCK), json_errors=False)
+
+
+def clear_lock(args: argparse.Namespace) -> None:
+    """Clear the task operator Redis lock."""
+    print_result(make_request(_api.LOCK, method='DELETE'), json_errors=False)
+
+
+COMMANDS: Dict[str, Command] = {
+    'create-agent': (
+        'Create a new agent (BullMQ job) that makes HTTP requests to a target URL',
+        add_create_agent_arguments, create_agent,
+    ),
+    'delete-agent': (
+        'Delete/remove an agent from the cursor-agents system',
+        add_delete_agent_arguments, delete_agent,
+    ),
+    'get-agent-status': (
+        'Get the status of a specific agent',
+        add_get_agent_status_arguments, get_agent_status,
+    ),
+    'delete-queue': (
+        'Delete an empty queue from the cursor-agents system',
+        add_queue_name_argument, delete_queue,
+    ),
+    'enable-task-operator': (
+        'Enable the task operator agent',
+        add_task_operator_queue_argument, enable_task_operator,
+    ),
+    'disable-task-operator': (
+        'Disable the task operator agent',
+        add_no_arguments, disable_task_operator,
+    ),
+    'check-lock': (
+        'Check the task operator Redis lock status',
+        add_no_arguments, check_lock,
+    ),
+    'clear-lock': (
+        'Clear the task operator Redis lock',
+        add_no_arguments, clear_lock,
+    ),
+}
+
+
+# Commands whose fixed options _miniargs can parse without building argparse parsers
+SIMPLE_OPTIONS: Dict[str, Spec] = {
+    'delete-agent': {'name': ('-n', True)},
+    'get-agent-status': {'name': ('-n', True)},
+    'delete-queue': {'queue_name': ('-q', True)},
+    'enable-task-operator': {'queue': ('-q', False)},
+    'disable-task-operator': {},
+    'check-lock': {},
+    'clear-lock': {},
+}
+
+# (command, epilog, standalone) -> parser built by build_parser()
+_PARSERS: Dict[Tuple[Optional[str], Optional[str], bool], argparse.ArgumentParser] = {}
+
+
+def build_parser(command: Optional[str] = None, epilog: Optional[str] = None,
+                 standalone: bool = False) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    When the command is already known only its subparser is registered, so a
+    normal invocation never builds the other seven. With standalone, the
+    command's options go on a plain top-level parser instead, so the
+    per-command scripts show their own usage without a subcommand. Parsers
+    are cached, so repeated main() calls in one process build each one only
+    once.
+    """
+    key = (command, epilog, standalone)
+    if key in _PARSERS:
+        return _PARSERS[key]
+
+    import argparse
+
+    if standalone:
+        help_text, add_arguments, _ = COMMANDS[command]
+        parser = argparse.ArgumentParser(
+            description=help_text,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=epilog
+        )
+        add_arguments(parser)
+        _PARSERS[key] = parser
+        return parser
+
+    parser = argparse.ArgumentParser(
+        description="Manage cursor-agents agents, queues and the task operator",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='<command>', required=True)
+
+    for name in ([command] if command else COMMANDS):
+        help_text, add_arguments, _ = COMMANDS[name]
+        subparser = subparsers.add_parser(
+            name,
+            help=help_text,
+            description=help_text,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=epilog
+        )
+        add_arguments(subparser)
+
+    _PARSERS[key] = parser
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, epilog: Optional[str] = None,
+         command: Optional[str] = None) -> None:
+    """Main entry point.
+
+    The per-command scripts pass their command, and argv then holds only
+    that command's options.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    standalone = command is not None
+    if standalone:
+        options = argv
+    else:
+        command = argv[0] if argv and argv[0] in COMMANDS else None
+        options = argv[1:]
+
+    # Fast path for the fixed-schema commands; argparse handles --help,
+    # errors and anything _miniargs doesn't recognize
+    args = None
+    if command in SIMPLE_OPTIONS:
+        from _miniargs import parse
+        args = parse(SIMPLE_OPTIONS[command], options)
+    if args is None:
+        if standalone:
+            args = build_parser(command, epilog, standalone=True).parse_args(options)
+        else:
+            args = build_parser(command, epilog).parse_args(argv)
+            command = args.command
+
+    COMMANDS[command][2](args)
+
+
+if __name__ == '__main__':
+    main()
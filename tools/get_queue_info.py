@@ -5,11 +5,16 @@ Get Queue Info Tool
 Gets detailed information about a specific queue.
 
 Usage:
-    python get_queue_info.py --queue-name <queue-name>
+    python get_queue_info.py --queue-name <queue-name> [--fields <field,...>]
 
 Required Arguments:
     --queue-name, -q         Name of the queue to get information for
 
+Optional Arguments:
+    --fields, -f             Comma-separated top-level fields to output (e.g. "waiting,active").
+                             When "agents" isn't requested and ijson is installed, the
+                             response is parsed incrementally and the agent list is skipped.
+
 Output:
     Returns a JSON object containing:
     - name: Queue name
@@ -22,6 +27,7 @@ Output:
 
 Example:
     python get_queue_info.py --queue-name "default"
+    python get_queue_info.py --queue-name "default" --fields waiting,active,failed
 
 Example Output:
     {
@@ -48,74 +54,91 @@ Note:
 """
 
 import argparse
-import json
-import os
-import sys
-import urllib.request
-import urllib.error
+
+from _api import queue_url
+
+
+PARSER = argparse.ArgumentParser(
+    description="Get detailed information about a specific queue",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog=__doc__
+)
+
+PARSER.add_argument(
+    '--queue-name', '-q',
+    required=True,
+    dest='queue_name',
+    help='Name of the queue to get information for'
+)
+PARSER.add_argument(
+    '--fields', '-f',
+    help='Comma-separated top-level fields to output (e.g. "waiting,active")'
+)
 
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Get detailed information about a specific queue",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=__doc__
-    )
-    
-    parser.add_argument(
-        '--queue-name', '-q',
-        required=True,
-        dest='queue_name',
-        help='Name of the queue to get information for'
-    )
-    
-    return parser.parse_args()
-
-
-def make_request(url: str) -> dict:
-    """Make HTTP request to cursor-agents API."""
-    request = urllib.request.Request(url)
-    
-    try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {'error': error_data.get('error', error_body), 'status': e.code}
-        except json.JSONDecodeError:
-            return {'error': error_body, 'status': e.code}
-    except Exception as e:
-        return {'error': str(e)}
+    return PARSER.parse_args()
 
 
-def main():
-    """Main entry point."""
-    args = parse_arguments()
-    
-    # Get API URL from environment or use default
-    api_url = os.getenv('CURSOR_AGENTS_URL', 'http://cursor-agents:3002')
-    url = f"{api_url}/queues/{args.queue_name}"
-    
-    # Make HTTP request to get queue info
-    result = make_request(url)
-    
-    if 'error' in result:
-        print(json.dumps(result, indent=2), file=sys.stderr)
-        sys.exit(1)
-    
-    # Output the result
-    print(json.dumps(result, indent=2, default=str))
+def _starts_object(data: bytes) -> bool:
+    """Whether the first non-whitespace byte of data opens a JSON object."""
+    for byte in data:
+        if byte not in b' \t\r\n':
+            return byte == ord('{')
+    return False
 
 
-if __name__ == '__main__':
-    main()
+def select_fields(data: bytes, fields: list) -> dict:
+    """Return only the requested top-level fields of a JSON object.
 
+    The agent list comes last in the response, so when it isn't requested
+    and ijson is available, parsing stops once every requested field has
+    been seen instead of materializing the whole document. Anything ijson
+    can't handle (invalid JSON, integers beyond 64 bits) is left to loads.
+    """
+    from _jsonfast import loads
 
+    # kvitems() silently yields nothing for a non-object, so only objects go to ijson
+    if 'agents' not in fields and _starts_object(data):
+        try:
+            import ijson
+        except ImportError:
+            pass
+        else:
+            import io
+
+            found = {}
+            try:
+                for key, value in ijson.kvitems(io.BytesIO(data), '', use_float=True):
+                    if key in fields:
+                        found[key] = value
+                        if len(found) == len(fields):
+                            break
+            except ijson.JSONError:
+                pass
+            else:
+                return {field: found[field] for field in fields if field in found}
+
+    parsed = loads(data)
+    if not isinstance(parsed, dict):
+        raise ValueError(f'Expected a JSON object, got {type(parsed).__name__}')
+    return {field: parsed[field] for field in fields if field in parsed}
 
 
+def main():
+    """Main entry point."""
+    args = parse_arguments()
+    from _client import make_request, print_result
+
+    fields = None
+    if args.fields:
+        fields = [field.strip() for field in args.fields.split(',') if field.strip()]
 
+    # Make HTTP request to get queue info
+    parse = (lambda data: select_fields(data, fields)) if fields else None
+    print_result(make_request(queue_url(args.queue_name), parse=parse))
 
 
+if __name__ == '__main__':
+    main()
@@ -44,48 +44,19 @@ Note:
     2. Or make an HTTP request to the cursor-agents API
 """
 
-import json
-import os
-import sys
-import urllib.request
-import urllib.error
+from _api import AGENTS
+from _client import get_json, print_result
 
 
-def make_request(url: str) -> dict:
-    """Make HTTP request to cursor-agents API."""
-    request = urllib.request.Request(url)
-    
-    try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        try:
-            error_data = json.loads(error_body)
-            return {'error': error_data.get('error', error_body), 'status': e.code}
-        except json.JSONDecodeError:
-            return {'error': error_body, 'status': e.code}
-    except Exception as e:
-        return {'error': str(e)}
+def list_agents() -> dict:
+    """Fetch all active agents, or an error dict."""
+    return get_json(AGENTS)
 
 
 def main():
     """Main entry point."""
-    # Get API URL from environment or use default
-    api_url = os.getenv('CURSOR_AGENTS_URL', 'http://cursor-agents:3002')
-    url = f"{api_url}/agents"
-    
-    # Make HTTP request to list agents
-    result = make_request(url)
-    
-    if 'error' in result:
-        print(json.dumps(result, indent=2), file=sys.stderr)
-        sys.exit(1)
-    
-    # Output the result
-    print(json.dumps(result, indent=2, default=str))
+    print_result(list_agents())
 
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+List All Tool
+
+Lists all agents and all queues in one call. This replaces running
+list_agents.py and list_queues.py back to back: both requests are sent
+concurrently from a single process.
+
+Usage:
+    python list_all.py
+
+This tool has no arguments.
+
+Output:
+    Returns a JSON object with the agents (as from list_agents.py) and the
+    queues (as from list_queues.py):
+    {
+      "agents": [
+        {
+          "name": "daily-check",
+          "isActive": true,
+          ...
+        }
+      ],
+      "queues": [
+        {
+          "name": "default",
+          "waiting": 0,
+          ...
+        }
+      ]
+    }
+
+    If either request fails, its error is reported on stderr and the tool
+    exits with status 1.
+"""
+
+from _api import AGENTS, QUEUES
+from _client import get_many, print_result
+
+
+def list_all() -> dict:
+    """Fetch all agents and queues, or the first error dict."""
+    results = get_many([AGENTS, QUEUES])
+    for result in results.values():
+        if 'error' in result:
+            return result
+    return {**results[AGENTS], **results[QUEUES]}
+
+
+def main():
+    """Main entry point."""
+    print_result(list_all())
+
+
+if __name__ == '__main__':
+    main()
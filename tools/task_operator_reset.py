@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Reset Task Operator Tool
+
+Disables the task operator and clears its Redis lock in one step. This
+replaces running check_task_operator_lock.py, clear_task_operator_lock.py and
+disable_task_operator.py one after another. Both requests are sent
+concurrently from a single process.
+
+Usage:
+    python task_operator_reset.py
+
+Output:
+    Returns a JSON object with the response of each request:
+    {
+      "disable": {
+        "success": true,
+        "message": "Task operator disabled successfully. ..."
+      },
+      "clearLock": {
+        "success": true,
+        "message": "Task operator Redis lock cleared successfully",
+        "lockCleared": true
+      }
+    }
+
+    clearLock.lockCleared tells whether the lock was held before the reset,
+    so no separate lock check is needed.
+
+    Exits with status 1 if either request failed; the failed entry then
+    contains an "error" field.
+
+WARNING:
+    Like clear_task_operator_lock.py, only use this if you're sure no task is
+    currently being processed.
+"""
+
+import sys
+
+import _api
+from _client import make_request
+
+
+def reset() -> dict:
+    """Disable the task operator and clear its lock concurrently."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        disable = executor.submit(make_request, _api.TASK_OPERATOR, 'DELETE')
+        clear_lock = executor.submit(make_request, _api.LOCK, 'DELETE')
+        return {'disable': disable.result(), 'clearLock': clear_lock.result()}
+
+
+def main():
+    """Main entry point."""
+    if len(sys.argv) > 1:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            description="Disable the task operator and clear its Redis lock",
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=__doc__
+        )
+        parser.parse_args()
+
+    from _jsonfast import write
+
+    result = reset()
+    write(result)
+
+    if any('error' in response for response in result.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()